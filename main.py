@@ -1,8 +1,15 @@
+import bisect
 import pygame
 import sys
 
 pygame.init()
 
+# Bind hot pygame entry points once: saves the pygame.draw.rect style
+# double attribute lookup on every draw call in the hot paths
+_draw_rect = pygame.draw.rect
+_draw_circle = pygame.draw.circle
+_Rect = pygame.Rect
+
 # Set up window
 width, height = 800, 600
 screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
@@ -10,27 +17,40 @@ pygame.display.set_caption("Shape Hierarchy with Matching Borders")
 
 clock = pygame.time.Clock()
 
+background_color = (30, 30, 30)
+
 # Define the font and color customization
 default_font = "arial"
 default_font_size = 24
 default_font_color = (255, 255, 0)
 
+# Caches so we don't rebuild fonts / re-render static text every frame
+_font_cache = {}  # (name, size) -> pygame.font.Font
+_text_cache = {}  # (message, name, size, color) -> rendered Surface
+
 def display_message(message, pos_x, pos_y, font_size=default_font_size, font_color=default_font_color):
     """Displays a given message at a position relative to the window size."""
     # Convert relative positions (float) to pixel positions
     x = pos_x * width
     y = pos_y * height
-    
+
     # Resize font based on window size (optional scaling factor)
     scale_factor = width / 800  # Scale based on window width
     scaled_font_size = int(font_size * scale_factor)
-    
-    # Create a font object with the new size
-    font = pygame.font.SysFont(default_font, scaled_font_size)
-    
-    # Render the message
-    text = font.render(message, True, font_color)
-    
+
+    # Reuse the font object for this name/size if we already built one
+    font_key = (default_font, scaled_font_size)
+    font = _font_cache.get(font_key)
+    if font is None:
+        font = _font_cache.setdefault(font_key, pygame.font.SysFont(default_font, scaled_font_size))
+
+    # Render the message (cached, since the text rarely changes)
+    text_key = (message, font_key, font_color)
+    text = _text_cache.get(text_key)
+    if text is None:
+        # convert_alpha keeps the blit on SDL's fast direct-copy path
+        text = _text_cache.setdefault(text_key, font.render(message, True, font_color).convert_alpha())
+
     # Get the rect of the text to position it
     text_rect = text.get_rect()
     text_rect.topleft = (x, y)
@@ -39,21 +59,55 @@ def display_message(message, pos_x, pos_y, font_size=default_font_size, font_col
     screen.blit(text, text_rect)
 
 # Color name → RGB
+_colors = {
+    "gray": (128, 128, 128),
+    "lightgray": (180, 180, 180),
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "white": (255, 255, 255),
+    "black": (0, 0, 0),
+    "yellow": (255, 255, 0),
+}
+
 def get_color(name):
-    colors = {
-        "gray": (128, 128, 128),
-        "lightgray": (180, 180, 180),
-        "red": (255, 0, 0),
-        "green": (0, 255, 0),
-        "blue": (0, 0, 255),
-        "white": (255, 255, 255),
-        "black": (0, 0, 0),
-        "yellow": (255, 255, 0),
-    }
-    return colors.get(name.lower(), (255, 255, 255))  # default to white
+    return _colors.get(name.lower(), (255, 255, 255))  # default to white
+
+# Pre-rendered circle sprites: pygame.draw.circle does per-pixel work
+# every call, a blit of the same circle is much cheaper. Cleared on
+# resize since radii change with the window.
+_circle_cache = {}  # (radius, color, border_thickness) -> Surface
+
+def _get_circle_surface(radius, color, border_thickness=0):
+    """Return a cached alpha surface with this circle rendered into it.
+
+    border_thickness of 0 means a filled circle; anything else renders
+    just the ring, with room for the border overhanging the radius.
+    """
+    key = (radius, color, border_thickness)
+    surf = _circle_cache.get(key)
+    if surf is None:
+        outer = radius + border_thickness
+        surf = pygame.Surface((outer * 2, outer * 2), pygame.SRCALPHA)
+        if border_thickness:
+            _draw_circle(surf, color, (outer, outer),
+                               radius + border_thickness // 2, border_thickness)
+        else:
+            _draw_circle(surf, color, (outer, outer), radius)
+        # Match the display format so blits skip per-pixel conversion
+        surf = surf.convert_alpha()
+        _circle_cache[key] = surf
+    return surf
 
 class Shape:
-    def __init__(self, shape_type: str, color: str, size: float, rel_pos, parent=None, 
+    # No per-instance __dict__: faster attribute access in the draw loop
+    # and less memory once scenes hold many shapes
+    __slots__ = ('shape_type', 'color', 'size', 'rel_pos', 'parent', 'children',
+                 'interactable', 'has_border', 'border_thickness', 'z_order',
+                 'scene', '_rgb', '_highlight_rgb', '_border_rgb',
+                 '_center', '_rect', '_radius', '_hit_rect')
+
+    def __init__(self, shape_type: str, color: str, size: float, rel_pos, parent=None,
                  interactable=False, has_border=False, border_thickness=3, z_order=0):
         self.shape_type = shape_type
         self.color = color
@@ -67,150 +121,411 @@ class Shape:
         self.z_order = z_order
         self.scene = None  # Will be set when added to scene
 
+        # Resolve colors once; the draw loop just reads tuples
+        self._rgb = get_color(color)
+        self._highlight_rgb = tuple(min(c + 40, 255) for c in self._rgb)
+        self._border_rgb = (0, 0, 0)
+
+        # Screen-space geometry, filled in by the scene's transform cache
+        self._center = None
+        self._rect = None
+        self._radius = 0
+        self._hit_rect = None
+
         if parent:
             parent.children.append(self)
 
     def get_absolute_position(self, root_size):
         """Calculate screen-space position based on parent or window."""
-        if self.parent:
-            parent_pos = self.parent.get_absolute_position(root_size)
-            parent_size = self.parent.get_pixel_size(root_size)
-            return (
-                parent_pos[0] + int(parent_size[0] * self.rel_pos[0]),
-                parent_pos[1] + int(parent_size[1] * self.rel_pos[1])
-            )
-        else:
-            return (
-                int(root_size[0] * self.rel_pos[0]),
-                int(root_size[1] * self.rel_pos[1])
-            )
+        # Walk the parent chain once with an accumulator instead of
+        # recursing (which also re-derived min(root_size) at every level)
+        base = min(root_size)
+        chain = []
+        shape = self
+        while shape.parent:
+            chain.append(shape)
+            shape = shape.parent
+        x = int(root_size[0] * shape.rel_pos[0])
+        y = int(root_size[1] * shape.rel_pos[1])
+        for node in reversed(chain):
+            parent_size = int(base * node.parent.size)
+            x += int(parent_size * node.rel_pos[0])
+            y += int(parent_size * node.rel_pos[1])
+        return (x, y)
 
     def get_pixel_size(self, root_size):
         base = min(root_size)
         return (int(base * self.size), int(base * self.size))
 
-    def check_interaction(self, screen_pos, size, mouse_pos):
-        """Returns True if mouse is over this shape"""
-        rect = pygame.Rect(
-            screen_pos[0] - size[0] // 2,
-            screen_pos[1] - size[1] // 2,
+    def update_geometry(self, pos, size):
+        """Cache screen-space rect/center/radius (called once per resize)."""
+        self._center = pos
+        self._rect = _Rect(
+            pos[0] - size[0] // 2,
+            pos[1] - size[1] // 2,
             size[0],
             size[1]
         )
-        
+        self._radius = size[0] // 2
+        # Broad-phase rect for the quadtree. Rect.collidepoint excludes
+        # the right/bottom edges, but the exact circle test is inclusive
+        # (<= r*r), so pad circles by a pixel each side to keep the
+        # broad phase conservative at the boundary.
+        if self.shape_type == "circle":
+            self._hit_rect = self._rect.inflate(2, 2)
+        else:
+            self._hit_rect = self._rect
+
+    def check_interaction(self, mouse_pos):
+        """Returns True if mouse is over this shape"""
         if self.shape_type == "square":
-            return rect.collidepoint(mouse_pos)
+            return self._rect.collidepoint(mouse_pos)
         elif self.shape_type == "circle":
             # For circles, check if mouse is within radius
-            center = (screen_pos[0], screen_pos[1])
-            radius = size[0] // 2
-            dx = mouse_pos[0] - center[0]
-            dy = mouse_pos[1] - center[1]
-            return (dx * dx + dy * dy) <= (radius * radius)
+            dx = mouse_pos[0] - self._center[0]
+            dy = mouse_pos[1] - self._center[1]
+            return (dx * dx + dy * dy) <= (self._radius * self._radius)
         return False
 
-    def draw(self, screen, root_size):
+    def draw(self, screen):
         """Draw the shape normally"""
-        size = self.get_pixel_size(root_size)
-        pos = self.get_absolute_position(root_size)
-        
-        draw_color = get_color(self.color)
-        self._draw_shape(screen, pos, size, draw_color)
+        self._draw_shape(screen, self._rgb)
         if self.has_border:
-            self._draw_border(screen, pos, size)
-            
-    def draw_highlighted(self, screen, root_size):
+            self._draw_border(screen)
+
+    def draw_highlighted(self, screen):
         """Draw the shape in its highlighted state"""
-        size = self.get_pixel_size(root_size)
-        pos = self.get_absolute_position(root_size)
-        
-        highlight_color = tuple(min(c + 40, 255) for c in get_color(self.color))
-        self._draw_shape(screen, pos, size, highlight_color)
+        self._draw_shape(screen, self._highlight_rgb)
         if self.has_border:
-            self._draw_border(screen, pos, size)
-            
-    def _draw_shape(self, screen, pos, size, color):
+            self._draw_border(screen)
+
+    def _draw_shape(self, screen, color):
         """Internal method for drawing the shape"""
         if self.shape_type == "square":
-            pygame.draw.rect(screen, color, pygame.Rect(
-                pos[0] - size[0] // 2,
-                pos[1] - size[1] // 2,
-                size[0],
-                size[1]
-            ))
+            _draw_rect(screen, color, self._rect)
         elif self.shape_type == "circle":
-            pygame.draw.circle(screen, color, pos, size[0] // 2)
-            
-    def _draw_border(self, screen, pos, size):
+            surf = _get_circle_surface(self._radius, color)
+            screen.blit(surf, (self._center[0] - self._radius,
+                               self._center[1] - self._radius))
+
+    def _draw_border(self, screen):
         """Internal method for drawing the border"""
-        border_color = get_color("black")
         if self.shape_type == "square":
-            pygame.draw.rect(screen, border_color, pygame.Rect(
-                pos[0] - size[0] // 2,
-                pos[1] - size[1] // 2,
-                size[0],
-                size[1]
-            ), self.border_thickness)
+            _draw_rect(screen, self._border_rgb, self._rect, self.border_thickness)
         elif self.shape_type == "circle":
-            pygame.draw.circle(screen, border_color, pos, 
-                size[0] // 2 + self.border_thickness // 2, 
-                self.border_thickness)
+            surf = _get_circle_surface(self._radius, self._border_rgb, self.border_thickness)
+            offset = self._radius + self.border_thickness
+            screen.blit(surf, (self._center[0] - offset,
+                               self._center[1] - offset))
 
     def handle_click(self):
         """Handle click events"""
         print(f"{self.shape_type.capitalize()} (z:{self.z_order}) was clicked!")
         # Future: self.on_click()
 
+def flatten_tree(roots):
+    """Flatten shape trees into a parent-before-child list.
+
+    Iterative (explicit stack) so deep hierarchies never pay Python call
+    overhead or hit the recursion limit.
+    """
+    order = []
+    stack = list(reversed(roots))
+    while stack:
+        shape = stack.pop()
+        order.append(shape)
+        stack.extend(reversed(shape.children))
+    return order
+
+class _Quadtree:
+    """Small point-region quadtree over shape bounding rects.
+
+    Overkill for one safe, but keeps hover hit-testing O(log N + k) once
+    the lockpicking minigames start adding hundreds of shapes.
+    """
+    __slots__ = ('bounds', 'depth', 'shapes', 'children')
+
+    MAX_SHAPES = 4
+    MAX_DEPTH = 6
+
+    def __init__(self, bounds, depth=0):
+        self.bounds = bounds
+        self.depth = depth
+        self.shapes = []
+        self.children = None
+
+    def insert(self, shape):
+        if self.children is not None:
+            rect = shape._hit_rect
+            for child in self.children:
+                if child.bounds.colliderect(rect):
+                    child.insert(shape)
+            return
+        self.shapes.append(shape)
+        if len(self.shapes) > self.MAX_SHAPES and self.depth < self.MAX_DEPTH:
+            self._split()
+
+    def _split(self):
+        x, y, w, h = self.bounds
+        hw, hh = w // 2, h // 2
+        depth = self.depth + 1
+        self.children = [
+            _Quadtree(_Rect(x, y, hw, hh), depth),
+            _Quadtree(_Rect(x + hw, y, w - hw, hh), depth),
+            _Quadtree(_Rect(x, y + hh, hw, h - hh), depth),
+            _Quadtree(_Rect(x + hw, y + hh, w - hw, h - hh), depth),
+        ]
+        shapes, self.shapes = self.shapes, []
+        for shape in shapes:
+            self.insert(shape)
+
+    def query(self, point, out):
+        """Collect shapes whose bounding rect contains point into out."""
+        if self.children is not None:
+            for child in self.children:
+                if child.bounds.collidepoint(point):
+                    child.query(point, out)
+        else:
+            for shape in self.shapes:
+                if shape._hit_rect.collidepoint(point):
+                    out.append(shape)
+
+# Below this many interactable shapes, a flat scan beats walking the
+# quadtree; above it the tree's O(log N + k) query wins
+_BATCH_HIT_MAX = 32
+
+def _batch_hit_test(lefts, tops, rights, bottoms, cxs, cys, r2s, circles, mx, my):
+    """Scan struct-of-arrays hit data, topmost first; returns index or -1.
+
+    Plain indexed loop over parallel lists: no shape-object attribute
+    access in the loop body, just local list reads and arithmetic.
+    """
+    for i in range(len(lefts)):
+        if circles[i]:
+            dx = mx - cxs[i]
+            dy = my - cys[i]
+            if dx * dx + dy * dy <= r2s[i]:
+                return i
+        elif lefts[i] <= mx < rights[i] and tops[i] <= my < bottoms[i]:
+            return i
+    return -1
+
 class SceneManager:
     def __init__(self):
         self.root_shapes = []
         self.all_shapes = []  # Flat list for easy z-order operations
-        
+        self._sorted_asc = []  # all_shapes kept sorted by z-order
+        self._sorted_desc = []  # same list, highest z first
+        self._cache_key = None  # root_size the cache was built for
+        # Struct-of-arrays scene topology (rebuilt when shapes change):
+        # the resize pass runs over these flat arrays instead of objects
+        self._topo_shapes = None
+        self._rel_xs = []
+        self._rel_ys = []
+        self._size_mults = []
+        self._parent_idxs = []  # index into _topo_shapes, -1 for roots
+        self._static_surface = None  # whole scene pre-rendered once per resize
+        self._quadtree = None  # spatial index over interactable shapes
+        self._last_hovered = None  # hover result from the most recent frame
+        self._last_hover_rect = None  # screen area the last highlight touched
+        self._draw_cmds = []  # flat (func, args) list in draw order
+        # Struct-of-arrays hit-test data (interactable shapes, topmost first)
+        self._hit_shapes = []
+        self._hit_lefts = []
+        self._hit_tops = []
+        self._hit_rights = []
+        self._hit_bottoms = []
+        self._hit_cxs = []
+        self._hit_cys = []
+        self._hit_r2s = []
+        self._hit_circles = []
+
     def add_shape(self, shape):
         if not shape.parent:
             self.root_shapes.append(shape)
         self.all_shapes.append(shape)
-        
+        # Keep the draw-order lists sorted as shapes come in so the
+        # per-frame passes never need to sort anything.
+        bisect.insort(self._sorted_asc, shape, key=lambda s: s.z_order)
+        self._sorted_desc = self._sorted_asc[::-1]
+        self._topo_shapes = None  # topology changed
+        self._cache_key = None  # force a cache rebuild
+
+    def _rebuild_topology(self):
+        """Capture the shape tree into parallel arrays, parents first."""
+        shapes = flatten_tree(self.root_shapes)
+        index_of = {id(s): i for i, s in enumerate(shapes)}
+        self._topo_shapes = shapes
+        self._rel_xs = [s.rel_pos[0] for s in shapes]
+        self._rel_ys = [s.rel_pos[1] for s in shapes]
+        self._size_mults = [s.size for s in shapes]
+        self._parent_idxs = [index_of[id(s.parent)] if s.parent else -1
+                             for s in shapes]
+
+    def _ensure_cache(self, root_size):
+        """Rebuild the position/size cache if the window size changed."""
+        if self._cache_key == root_size:
+            return
+        _circle_cache.clear()  # radii change with the window
+        if self._topo_shapes is None:
+            self._rebuild_topology()
+
+        # Resolve every transform in one flat pass over the topology
+        # arrays: parents come first, so each entry gathers from an
+        # already-computed parent index -- no object walks, no recursion
+        shapes = self._topo_shapes
+        rel_xs, rel_ys = self._rel_xs, self._rel_ys
+        parent_idxs = self._parent_idxs
+        root_w, root_h = root_size
+        base = min(root_size)
+        n = len(shapes)
+        sizes = [int(base * m) for m in self._size_mults]
+        abs_xs = [0] * n
+        abs_ys = [0] * n
+        for i in range(n):
+            p = parent_idxs[i]
+            if p < 0:
+                abs_xs[i] = int(root_w * rel_xs[i])
+                abs_ys[i] = int(root_h * rel_ys[i])
+            else:
+                psize = sizes[p]
+                abs_xs[i] = abs_xs[p] + int(psize * rel_xs[i])
+                abs_ys[i] = abs_ys[p] + int(psize * rel_ys[i])
+        for i in range(n):
+            shapes[i].update_geometry((abs_xs[i], abs_ys[i]), (sizes[i], sizes[i]))
+        self._cache_key = root_size
+
+        # Flatten the scene into a plain command list so the rasterize
+        # loop below runs without any per-shape attribute/method lookups.
+        # One list (not one per primitive) so z-order is preserved even
+        # if squares and circles interleave.
+        draw_rect = _draw_rect
+        draw_circle = _draw_circle
+        cmds = []
+        for shape in self._sorted_asc:
+            if shape.shape_type == "square":
+                cmds.append((draw_rect, (shape._rgb, shape._rect)))
+                if shape.has_border:
+                    cmds.append((draw_rect, (shape._border_rgb, shape._rect,
+                                             shape.border_thickness)))
+            elif shape.shape_type == "circle":
+                cmds.append((draw_circle, (shape._rgb, shape._center, shape._radius)))
+                if shape.has_border:
+                    cmds.append((draw_circle, (shape._border_rgb, shape._center,
+                                               shape._radius + shape.border_thickness // 2,
+                                               shape.border_thickness)))
+        self._draw_cmds = cmds
+
+        # Rasterize the whole scene once; each frame just blits this
+        # instead of re-issuing a draw call per shape.
+        static = pygame.Surface(root_size)
+        static.fill(background_color)
+        for func, args in cmds:
+            func(static, *args)
+        # Match the display format so the per-frame blit is a plain copy
+        self._static_surface = static.convert()
+
+        # Rebuild the spatial index from the freshly cached rects
+        quadtree = _Quadtree(_Rect(0, 0, root_size[0], root_size[1]))
+        for shape in self.all_shapes:
+            if shape.interactable:
+                quadtree.insert(shape)
+        self._quadtree = quadtree
+
+        # Mirror the interactable shapes into parallel arrays (topmost
+        # first) so small scenes can hit-test with a flat scan that never
+        # touches a shape object
+        hit_shapes = [s for s in self._sorted_desc if s.interactable]
+        self._hit_shapes = hit_shapes
+        self._hit_lefts = [s._rect.left for s in hit_shapes]
+        self._hit_tops = [s._rect.top for s in hit_shapes]
+        self._hit_rights = [s._rect.right for s in hit_shapes]
+        self._hit_bottoms = [s._rect.bottom for s in hit_shapes]
+        self._hit_cxs = [s._center[0] for s in hit_shapes]
+        self._hit_cys = [s._center[1] for s in hit_shapes]
+        self._hit_r2s = [s._radius * s._radius for s in hit_shapes]
+        self._hit_circles = [s.shape_type == "circle" for s in hit_shapes]
+
     def get_shape_at(self, mouse_pos, root_size):
-        # Get all shapes under the mouse, sorted by z-order (highest first)
-        shapes_under_mouse = [
-            shape for shape in sorted(self.all_shapes, key=lambda x: -x.z_order)
-            if shape.interactable and shape.check_interaction(
-                shape.get_absolute_position(root_size),
-                shape.get_pixel_size(root_size),
-                mouse_pos
+        self._ensure_cache(root_size)
+
+        # Small scenes: flat scan over the struct-of-arrays mirror
+        if len(self._hit_shapes) <= _BATCH_HIT_MAX:
+            idx = _batch_hit_test(
+                self._hit_lefts, self._hit_tops,
+                self._hit_rights, self._hit_bottoms,
+                self._hit_cxs, self._hit_cys,
+                self._hit_r2s, self._hit_circles,
+                mouse_pos[0], mouse_pos[1]
             )
-        ]
-        return shapes_under_mouse[0] if shapes_under_mouse else None
-    
+            return self._hit_shapes[idx] if idx >= 0 else None
+
+        # Larger scenes: narrow to shapes whose bounding box contains the
+        # cursor, then run the exact hit test and keep the topmost one
+        candidates = []
+        self._quadtree.query(mouse_pos, candidates)
+        topmost = None
+        for shape in candidates:
+            if shape.check_interaction(mouse_pos):
+                if topmost is None or shape.z_order > topmost.z_order:
+                    topmost = shape
+        return topmost
+
     def draw(self, screen, root_size, mouse_pos, mouse_click_pos):
-        # First pass: Draw all shapes in normal state
-        for shape in sorted(self.all_shapes, key=lambda x: x.z_order):
-            shape.draw(screen, root_size)
-            
-        # Second pass: Draw only the hovered shape again with highlight
-        # (if it exists and is interactable)
+        """Render the scene; returns the dirty rects to push to the
+        display, or None when the whole frame was redrawn."""
+        full_redraw = self._cache_key != root_size
+        self._ensure_cache(root_size)
+
+        # One hit test per frame -- the result is cached for the
+        # highlight, click dispatch and any external queries
+        prev_hover_rect = self._last_hover_rect
         hovered_shape = self.get_shape_at(mouse_pos, root_size)
+        self._last_hovered = hovered_shape
+        hover_rect = None
         if hovered_shape:
-            # Draw all shapes that are above our hovered shape again
-            # to maintain proper z-ordering
+            # Inflate to cover the border overhanging the shape rect
+            pad = hovered_shape.border_thickness * 2
+            hover_rect = hovered_shape._rect.inflate(pad, pad)
+        self._last_hover_rect = hover_rect
+
+        if full_redraw:
+            # Whole static scene (background included) in one blit
+            screen.blit(self._static_surface, (0, 0))
+            dirty_rects = None
+        else:
+            # Only repair the areas the highlight touched last frame and
+            # touches this frame; everything else on screen is still valid
+            dirty_rects = []
+            static = self._static_surface
+            if prev_hover_rect is not None:
+                screen.blit(static, prev_hover_rect, prev_hover_rect)
+                dirty_rects.append(prev_hover_rect)
+            if hover_rect is not None and hover_rect != prev_hover_rect:
+                screen.blit(static, hover_rect, hover_rect)
+                dirty_rects.append(hover_rect)
+
+        if hovered_shape:
+            # Draw the highlight, then any shapes that should appear
+            # above it to maintain proper z-ordering
             hover_z = hovered_shape.z_order
-            
-            # Draw the highlight
-            hovered_shape.draw_highlighted(screen, root_size)
-            
-            # Redraw any shapes that should appear above the highlighted shape
-            for shape in sorted(self.all_shapes, key=lambda x: x.z_order):
+            hovered_shape.draw_highlighted(screen)
+            for shape in self._sorted_asc:
                 if shape.z_order > hover_z:
-                    shape.draw(screen, root_size)
-            
-            # Handle click if needed
-            if mouse_click_pos and hovered_shape.check_interaction(
-                hovered_shape.get_absolute_position(root_size),
-                hovered_shape.get_pixel_size(root_size),
-                mouse_click_pos
-            ):
-                hovered_shape.handle_click()
+                    shape.draw(screen)
+
+        # Dispatch any click with one unified query: reuse the hover
+        # result when the click landed at the cursor position, otherwise
+        # hit-test the click position once
+        if mouse_click_pos:
+            if mouse_click_pos == mouse_pos:
+                clicked_shape = hovered_shape
+            else:
+                clicked_shape = self.get_shape_at(mouse_click_pos, root_size)
+            if clicked_shape:
+                clicked_shape.handle_click()
+
+        return dirty_rects
 
 def create_safe(open: bool, sizeMult: float):
     scene = SceneManager()
@@ -248,13 +563,14 @@ def create_safe(open: bool, sizeMult: float):
 # -------- Main Program --------
 running = True
 mouse_click_pos = None
+last_mouse_pos = None
+dirty = True  # force the first frame to render
 
 # Define shapes
 safe_scene = create_safe(False, 1.0)
 
 while running:
     mouse_click_pos = None
-    mouse_pos = pygame.mouse.get_pos()
 
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
@@ -262,20 +578,37 @@ while running:
         elif event.type == pygame.VIDEORESIZE:
             width, height = event.w, event.h
             screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+            dirty = True
         elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
             running = False
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mouse_click_pos = event.pos
 
-    screen.fill((30, 30, 30))
+    # Hit-test once per frame with the final mouse position, regardless
+    # of how many motion events arrived this frame
+    mouse_pos = pygame.mouse.get_pos()
+    if mouse_pos != last_mouse_pos or mouse_click_pos:
+        dirty = True
+    last_mouse_pos = mouse_pos
+
+    # Nothing moved, nothing clicked, no resize: the frame on screen is
+    # still correct, so skip rendering entirely and just keep pace
+    if dirty:
+        # Draw the full shape hierarchy using the scene manager
+        # (the scene blits its own pre-rendered background, fill included)
+        dirty_rects = safe_scene.draw(screen, (width, height), mouse_pos, mouse_click_pos)
 
-    # Draw the full shape hierarchy using the scene manager
-    safe_scene.draw(screen, (width, height), mouse_pos, mouse_click_pos)
+        # Text
+        display_message("Hello Player!", 0.1, 0.1)
 
-    # Text
-    display_message("Hello Player!", 0.1, 0.1)
+        if dirty_rects is None:
+            # First frame or resize: push the whole window
+            pygame.display.flip()
+        else:
+            # Only push the few rects the highlight actually changed
+            pygame.display.update(dirty_rects)
+        dirty = False
 
-    pygame.display.flip()
     clock.tick(60)
 
 pygame.quit()